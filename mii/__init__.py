@@ -2,9 +2,38 @@
 # SPDX-License-Identifier: Apache-2.0
 
 # DeepSpeed Team
+from typing import TYPE_CHECKING
+
 from .api import client, serve, pipeline
 
-from .legacy import MIIServer, MIIClient, mii_query_handle, deploy, terminate, DeploymentType, TaskType, aml_output_path, MIIConfig, ModelConfig, get_supported_models
+if TYPE_CHECKING:
+    from .legacy import MIIServer, MIIClient, mii_query_handle, deploy, terminate, DeploymentType, TaskType, aml_output_path, MIIConfig, ModelConfig, get_supported_models
+
+# The legacy API pulls in its own gRPC stubs and model loaders, so it is only
+# imported the first time one of these names is accessed
+_LEGACY_ATTRS = (
+    "MIIServer",
+    "MIIClient",
+    "mii_query_handle",
+    "deploy",
+    "terminate",
+    "DeploymentType",
+    "TaskType",
+    "aml_output_path",
+    "MIIConfig",
+    "ModelConfig",
+    "get_supported_models",
+)
+
+
+def __getattr__(name):
+    if name in _LEGACY_ATTRS:
+        from . import legacy
+        value = getattr(legacy, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __version__ = "0.0.0"
 try:
@@ -11,9 +11,8 @@ from mii.config import get_mii_config, ModelConfig, MIIConfig
 from mii.constants import DeploymentType
 from mii.errors import UnknownArgument
 from mii.modeling.models import load_model
-from mii.score import create_score_file
+from mii.score import create_score_file, build_score_module
 from mii.modeling.tokenizers import load_tokenizer
-from mii.utils import import_score_file
 
 
 def _parse_kwargs_to_model_config(
@@ -158,9 +157,10 @@ def serve(
     create_score_file(mii_config)
 
     if mii_config.deployment_type == DeploymentType.LOCAL:
-        # Imports the created score file and executes the init() function, then
-        # returns a MIIClient object. With the changes suggested in the comment
-        # above, importing the score file would not be necessary.
+        # Builds the score module (equivalent to importing the created score
+        # file) and executes the init() function, then returns a MIIClient
+        # object. With the changes suggested in the comment above, the score
+        # module would not be necessary.
 
         # How grpc server is created:
         # 1. The score.py file init() function makes a call to mii.backend.server.MIIServer()
@@ -176,7 +176,7 @@ def serve(
         #    can send/receive messages to/from the load balancer process. The load
         #    balancer process then acts as a middle layer between the client(s) and
         #    the model inference server(s)
-        import_score_file(mii_config.deployment_name, DeploymentType.LOCAL).init()
+        build_score_module(mii_config).init()
         return MIIClient(mii_config=mii_config)
     if mii_config.deployment_type == DeploymentType.AML:
         acr_name = mii.aml_related.utils.get_acr_name()
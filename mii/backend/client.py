@@ -4,7 +4,9 @@
 # DeepSpeed Team
 import asyncio
 import grpc
+import queue
 import requests
+import threading
 from typing import Dict, Any, Callable, List, Union
 
 from mii.batching.data_classes import Response
@@ -26,6 +28,21 @@ def create_channel(host, port):
     )
 
 
+_client_loop = None
+_client_loop_lock = threading.Lock()
+
+
+def _get_client_loop():
+    # All clients share one event loop running in a daemon thread, so requests
+    # can be sent from any thread, including ones that run their own loop
+    global _client_loop
+    with _client_loop_lock:
+        if _client_loop is None:
+            _client_loop = asyncio.new_event_loop()
+            threading.Thread(target=_client_loop.run_forever, daemon=True).start()
+    return _client_loop
+
+
 class MIIClient:
     """
     Client for sending generation requests to a persistent deployment created
@@ -39,11 +56,12 @@ class MIIClient:
         self.mii_config = mii_config
         self.task = mii_config.model_conf.task
         self.port = mii_config.port_number
-        self.asyncio_loop = asyncio.get_event_loop()
-        channel = create_channel(host, self.port)
+        self.asyncio_loop = _get_client_loop()
+        self._closed = False
+        self.channel = self._run(self._create_channel, host, self.port)
         # This stub allows interaction the client to send/receive messages with
         # the load balancer process
-        self.stub = modelresponse_pb2_grpc.ModelResponseStub(channel)
+        self.stub = modelresponse_pb2_grpc.ModelResponseStub(self.channel)
 
     def __call__(self, *args, **kwargs) -> List[Response]:
         """
@@ -55,6 +73,23 @@ class MIIClient:
         """
         return self.generate(*args, **kwargs)
 
+    async def _create_channel(self, host, port):
+        # gRPC aio channels are bound to the loop they are created on
+        return create_channel(host, port)
+
+    def _submit(self, coro_fn, *args, **kwargs):
+        if self._closed:
+            raise RuntimeError("MIIClient is closed")
+        return asyncio.run_coroutine_threadsafe(coro_fn(*args,
+                                                        **kwargs),
+                                                self.asyncio_loop)
+
+    def _run(self, coro_fn, *args, **kwargs):
+        return self._submit(coro_fn, *args, **kwargs).result()
+
+    async def _run_async(self, coro_fn, *args, **kwargs):
+        return await asyncio.wrap_future(self._submit(coro_fn, *args, **kwargs))
+
     async def _request_async_response(self, prompts, **query_kwargs):
         task_methods = TASK_METHODS_DICT[self.task]
         proto_request = task_methods.pack_request_to_proto(prompts, **query_kwargs)
@@ -93,39 +128,63 @@ class MIIClient:
             generate_kwargs["stream"] = True
             return self._generate_stream(streaming_fn, prompts, **generate_kwargs)
 
-        return self.asyncio_loop.run_until_complete(
-            self._request_async_response(prompts,
-                                         **generate_kwargs))
+        return self._run(self._request_async_response, prompts, **generate_kwargs)
 
     def _generate_stream(self,
                          callback,
                          prompts: List[str],
                          **query_kwargs: Dict[str,
                                               Any]) -> None:
-        async def put_result():
-            response_stream = self._request_async_response_stream(
-                prompts,
-                **query_kwargs)
+        # Responses are handed back through a queue so that the callback runs
+        # in the calling thread rather than on the shared client loop
+        result_queue = queue.Queue()
 
+        async def put_result():
+            try:
+                async for response in self._request_async_response_stream(
+                        prompts,
+                        **query_kwargs):
+                    result_queue.put(response)
+            finally:
+                result_queue.put(None)
+
+        future = self._submit(put_result)
+        try:
             while True:
-                try:
-                    response = await response_stream.__anext__()
-                    callback(response)
-                except StopAsyncIteration:
+                response = result_queue.get()
+                if response is None:
                     break
+                callback(response)
+        except BaseException:
+            future.cancel()
+            raise
+        future.result()
 
-        self.asyncio_loop.run_until_complete(put_result())
-
-    async def terminate_async(self) -> None:
+    async def _terminate(self) -> None:
         await self.stub.Terminate(
             modelresponse_pb2.google_dot_protobuf_dot_empty__pb2.Empty())
 
+    async def terminate_async(self) -> None:
+        await self._run_async(self._terminate)
+
     def terminate_server(self) -> None:
         """
         Terminates the persistent deployment server. This can be called from any
-        client.
+        client. The client is closed afterwards.
         """
-        self.asyncio_loop.run_until_complete(self.terminate_async())
+        try:
+            self._run(self._terminate)
+        finally:
+            self.close()
         if self.mii_config.enable_restful_api:
             requests.get(
                 f"http://localhost:{self.mii_config.restful_api_port}/terminate")
+
+    def close(self) -> None:
+        """
+        Closes the connection to the persistent deployment. The client cannot be
+        used afterwards.
+        """
+        if not self._closed:
+            self._run(self.channel.close)
+            self._closed = True
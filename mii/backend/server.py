@@ -15,6 +15,11 @@ from deepspeed.accelerator import get_accelerator
 from deepspeed.runtime.config_utils import DeepSpeedConfigModel
 
 from mii.config import ModelConfig, MIIConfig, ReplicaConfig
+from mii.constants import (
+    SERVER_START_POLL_INTERVAL_MIN,
+    SERVER_START_POLL_INTERVAL_MAX,
+    SERVER_START_LOG_INTERVAL,
+)
 from mii.logging import logger
 
 
@@ -53,6 +58,8 @@ class MIIServer:
                                    processes: List[subprocess.Popen],
                                    deployment: List[ReplicaConfig]):
         for process, repl_config in zip(processes, deployment):
+            poll_interval = SERVER_START_POLL_INTERVAL_MIN
+            last_log_time = time.time()
             sockets_open = False
             while not sockets_open:
                 sockets_open = all(
@@ -63,8 +70,13 @@ class MIIServer:
                 if not process_alive:
                     raise RuntimeError(
                         "server crashed for some reason, unable to proceed")
-                time.sleep(4)
-                logger.info("waiting for server to start...")
+                if not sockets_open:
+                    time.sleep(poll_interval)
+                    poll_interval = min(2 * poll_interval,
+                                        SERVER_START_POLL_INTERVAL_MAX)
+                    if time.time() - last_log_time >= SERVER_START_LOG_INTERVAL:
+                        logger.info("waiting for server to start...")
+                        last_log_time = time.time()
             # TODO: Fix displaying outputs from logger
             # When we launch processes on multiple nodes using " --force_multi",
             # all the outputs from logger to stdout is displayed when the process is stopped.
@@ -83,15 +95,8 @@ class MIIServer:
     def _is_server_process_alive(self, process: subprocess.Popen) -> bool:
         if process is None:
             return True
-        try:
-            process.wait(1)
-        except subprocess.TimeoutExpired as err:
-            # timeout means we're still running and all (probably) okay
-            is_alive = True
-        else:
-            # no exception case
-            is_alive = False
-        return is_alive
+        # poll() returns None while the process is still running
+        return process.poll() is None
 
     def _launch_server_process(self,
                                model_config: ModelConfig,
@@ -106,7 +111,7 @@ class MIIServer:
         server_args_str = " ".join(server_args)
         cmd = f"{ds_launch_str} {launch_str} {server_args_str}".strip().split(" ")
 
-        logger.info(f"msg_server launch: {cmd}")
+        logger.debug(f"{msg_server_type} server launch: {cmd}")
         return subprocess.Popen(cmd)
 
     def _generate_ds_launch_str(self,
@@ -3,7 +3,7 @@
 
 # DeepSpeed Team
 import os
-import string
+import re
 from typing import List, Optional, Union, Dict, Any, Literal
 
 from deepspeed.launcher.runner import DLTS_HOSTFILE, fetch_hostfile
@@ -17,6 +17,7 @@ from mii.modeling.tokenizers import MIITokenizerWrapper
 from mii.utils import generate_deployment_name, import_score_file
 
 DEVICE_MAP_DEFAULT = "auto"
+AML_DEPLOYMENT_NAME_RE = re.compile(r"[A-Za-z0-9-]*")
 
 
 class GenerateParamsConfig(DeepSpeedConfigModel):
@@ -283,10 +284,8 @@ class MIIConfig(DeepSpeedConfigModel):
     @model_validator(mode="after")
     def AML_name_valid(self) -> "MIIConfig":
         if self.deployment_type == DeploymentType.AML:
-            allowed_chars = set(string.ascii_lowercase + string.ascii_uppercase +
-                                string.digits + "-")
-            assert (
-                set(self.deployment_name) <= allowed_chars
+            assert AML_DEPLOYMENT_NAME_RE.fullmatch(
+                self.deployment_name
             ), "AML deployment names can only contain a-z, A-Z, 0-9, and '-'."
         return self
 
@@ -302,19 +301,22 @@ class MIIConfig(DeepSpeedConfigModel):
         return values
 
     def generate_replica_configs(self) -> None:
-        if self.model_conf.replica_configs:
+        model_conf = self.model_conf
+        if model_conf.replica_configs:
             return
-        torch_dist_port = self.model_conf.torch_dist_port
-        tensor_parallel = self.model_conf.tensor_parallel
+        port_number = self.port_number
+        torch_dist_port = model_conf.torch_dist_port
+        tensor_parallel = model_conf.tensor_parallel
+        zmq_port_number = model_conf.zmq_port_number
         replica_pool = _allocate_devices(self.hostfile,
                                          tensor_parallel,
-                                         self.model_conf.replica_num,
-                                         self.model_conf.device_map)
+                                         model_conf.replica_num,
+                                         model_conf.device_map)
         replica_configs = []
         for i, (hostname, gpu_indices) in enumerate(replica_pool):
             # Reserver port for a LB proxy when replication is enabled
             port_offset = 1
-            base_port = self.port_number + i * tensor_parallel + port_offset
+            base_port = port_number + i * tensor_parallel + port_offset
             tensor_parallel_ports = list(range(base_port, base_port + tensor_parallel))
             replica_torch_dist_port = torch_dist_port + (100 * i)
             replica_configs.append(
@@ -323,10 +325,10 @@ class MIIConfig(DeepSpeedConfigModel):
                     tensor_parallel_ports=tensor_parallel_ports,
                     torch_dist_port=replica_torch_dist_port,
                     gpu_indices=gpu_indices,
-                    zmq_port=self.model_conf.zmq_port_number + i,
+                    zmq_port=zmq_port_number + i,
                 ))
 
-        self.model_conf.replica_configs = replica_configs
+        model_conf.replica_configs = replica_configs
 
 
 def _allocate_devices(hostfile_path: str,
@@ -64,6 +64,12 @@ LB_MAX_WORKER_THREADS = 256
 
 SERVER_SHUTDOWN_TIMEOUT = 10
 
+# Seconds between checks for a server to start, doubled after each check
+SERVER_START_POLL_INTERVAL_MIN = 0.05
+SERVER_START_POLL_INTERVAL_MAX = 1.0
+# Seconds between "waiting for server to start" log messages
+SERVER_START_LOG_INTERVAL = 5
+
 RESTFUL_GATEWAY_SHUTDOWN_TIMEOUT = 1
 RESTFUL_API_PATH = "mii"
 
@@ -4,7 +4,6 @@
 # DeepSpeed Team
 # Standard library imports
 import json
-import grpc
 import argparse
 from typing import AsyncGenerator
 
@@ -14,9 +13,9 @@ import mii
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse, JSONResponse, Response
-from mii.grpc_related.proto.modelresponse_pb2_grpc import ModelResponseStub
 from mii.grpc_related.proto import modelresponse_pb2
 from mii.utils import kwarg_dict_to_proto
+from mii.entrypoints.utils import get_load_balancer_stub
 
 # Local module imports
 from .data_models import CompletionRequest
@@ -73,8 +72,7 @@ async def generate(request: CompletionRequest) -> Response:
     if request.stream:
         generate_args["stream"] = True
 
-    channel = grpc.aio.insecure_channel(load_balancer)
-    stub = ModelResponseStub(channel)
+    stub = get_load_balancer_stub(load_balancer)
     requestData = modelresponse_pb2.MultiStringRequest(
         request=request.prompt,
         query_kwargs=kwarg_dict_to_proto(generate_args),
@@ -6,7 +6,6 @@
 # Adapted from: https://github.com/lm-sys/FastChat/blob/af4dfe3f0ed481700265914af61b86e0856ac2d9/fastchat/serve/openai_api_server.py
 # Chat template adapted from: https://github.com/vllm-project/vllm/pull/1756
 
-import grpc
 import argparse
 import json
 import os
@@ -23,9 +22,9 @@ from fastapi.security.http import HTTPAuthorizationCredentials, HTTPBearer
 import shortuuid
 import uvicorn
 import mii
-from mii.grpc_related.proto.modelresponse_pb2_grpc import ModelResponseStub
 from mii.grpc_related.proto import modelresponse_pb2
 from mii.utils import kwarg_dict_to_proto
+from mii.entrypoints.utils import get_load_balancer_stub
 from fastchat.constants import ErrorCode
 
 from .data_models import (
@@ -178,8 +177,7 @@ async def create_chat_completion(request: ChatCompletionRequest):
     if request.stream:
         generate_args["stream"] = True
 
-    channel = grpc.aio.insecure_channel(load_balancer)
-    stub = ModelResponseStub(channel)
+    stub = get_load_balancer_stub(load_balancer)
 
     finalPrompt = tokenizer.apply_chat_template(
         conversation=request.messages,
@@ -320,8 +318,7 @@ async def create_completion(request: CompletionRequest):
     if request.stream:
         generate_args["stream"] = True
 
-    channel = grpc.aio.insecure_channel(load_balancer)
-    stub = ModelResponseStub(channel)
+    stub = get_load_balancer_stub(load_balancer)
     requestData = modelresponse_pb2.MultiStringRequest(
         request=request.prompt,
         query_kwargs=kwarg_dict_to_proto(generate_args),
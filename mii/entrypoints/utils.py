@@ -0,0 +1,29 @@
+# Copyright (c) Microsoft Corporation.
+# SPDX-License-Identifier: Apache-2.0
+
+# DeepSpeed Team
+import functools
+
+import grpc
+
+from mii.constants import GRPC_MAX_MSG_SIZE
+from mii.grpc_related.proto.modelresponse_pb2_grpc import ModelResponseStub
+
+
+@functools.lru_cache(maxsize=None)
+def get_load_balancer_stub(load_balancer: str) -> ModelResponseStub:
+    """
+    Get a stub for the load balancer at the gRPC target ``load_balancer``. One
+    channel is opened per target and shared by all requests, so this must be
+    called from within the server's event loop.
+    """
+    channel = grpc.aio.insecure_channel(
+        load_balancer,
+        options=[
+            ("grpc.max_send_message_length",
+             GRPC_MAX_MSG_SIZE),
+            ("grpc.max_receive_message_length",
+             GRPC_MAX_MSG_SIZE),
+        ],
+    )
+    return ModelResponseStub(channel)
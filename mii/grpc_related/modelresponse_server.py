@@ -23,6 +23,7 @@ from mii.constants import (
 )
 from mii.grpc_related.proto import modelresponse_pb2_grpc
 from mii.grpc_related.task_methods import TASK_METHODS_DICT, TaskMethods
+from mii.logging import logger
 
 
 class ServiceBase(modelresponse_pb2_grpc.ModelResponseServicer):
@@ -137,6 +138,15 @@ def _get_grpc_method_name(method):
     return method.split("/")[-1]
 
 
+def _first_response(method_name, responses):
+    for rank, response in enumerate(responses[1:], start=1):
+        if isinstance(response, Exception):
+            logger.warning(f"{method_name} failed on rank {rank}: {response}")
+    if isinstance(responses[0], Exception):
+        raise responses[0]
+    return responses[0]
+
+
 class ParallelStubInvoker:
     """
     Invokes a gRPC method on multiple endpoints in parallel.
@@ -154,16 +164,16 @@ class ParallelStubInvoker:
         self.asyncio_loop = asyncio.get_event_loop()
 
     async def _invoke_async(self, method_name, proto_request):
-        responses = []
-        if method_name == TERMINATE_METHOD:
-            stubs = self.stubs
-        else:
-            stubs = [self.stubs[0]
-                     ]  # Only the first stub is used for non-terminate methods
-        for stub in stubs:
-            method = getattr(stub, method_name)
-            responses.append(method(proto_request))
-        return await responses[0]
+        if method_name != TERMINATE_METHOD:
+            # Only the first stub is used for non-terminate methods
+            return await getattr(self.stubs[0], method_name)(proto_request)
+        # Every rank is asked to terminate even if another rank has already
+        # gone away, and only a failure on the first rank is raised
+        responses = await asyncio.gather(
+            *(getattr(stub,
+                      method_name)(proto_request) for stub in self.stubs),
+            return_exceptions=True)
+        return _first_response(method_name, responses)
 
     def invoke(self, method_name, proto_request):
         # This is needed because gRPC calls from interceptor are launched from
@@ -5,6 +5,7 @@
 import asyncio
 import grpc
 import requests
+import threading
 import mii.legacy as mii
 from .grpc_related.proto import legacymodelresponse_pb2 as modelresponse_pb2
 from .grpc_related.proto import legacymodelresponse_pb2_grpc as modelresponse_pb2_grpc
@@ -54,16 +55,49 @@ def create_channel(host, port):
     )
 
 
+_client_loop = None
+_client_loop_lock = threading.Lock()
+
+
+def _get_client_loop():
+    # All clients share one event loop running in a daemon thread, so queries
+    # can be sent from any thread, including ones that run their own loop
+    global _client_loop
+    with _client_loop_lock:
+        if _client_loop is None:
+            _client_loop = asyncio.new_event_loop()
+            threading.Thread(target=_client_loop.run_forever, daemon=True).start()
+    return _client_loop
+
+
 class MIIClient:
     """
     Client to send queries to a single endpoint.
     """
     def __init__(self, task, host, port):
-        self.asyncio_loop = asyncio.get_event_loop()
-        channel = create_channel(host, port)
-        self.stub = modelresponse_pb2_grpc.ModelResponseStub(channel)
+        self.asyncio_loop = _get_client_loop()
+        self._closed = False
+        self.channel = self._run(self._create_channel, host, port)
+        self.stub = modelresponse_pb2_grpc.ModelResponseStub(self.channel)
         self.task = task
 
+    async def _create_channel(self, host, port):
+        # gRPC aio channels are bound to the loop they are created on
+        return create_channel(host, port)
+
+    def _submit(self, coro_fn, *args, **kwargs):
+        if self._closed:
+            raise RuntimeError("MIIClient is closed")
+        return asyncio.run_coroutine_threadsafe(coro_fn(*args,
+                                                        **kwargs),
+                                                self.asyncio_loop)
+
+    def _run(self, coro_fn, *args, **kwargs):
+        return self._submit(coro_fn, *args, **kwargs).result()
+
+    async def _run_async(self, coro_fn, *args, **kwargs):
+        return await asyncio.wrap_future(self._submit(coro_fn, *args, **kwargs))
+
     async def _request_async_response(self, request_dict, **query_kwargs):
         if self.task not in GRPC_METHOD_TABLE:
             raise ValueError(f"unknown task: {self.task}")
@@ -73,38 +107,72 @@ class MIIClient:
         proto_response = await getattr(self.stub, task_methods.method)(proto_request)
         return task_methods.unpack_response_from_proto(proto_response)
 
+    async def query_async(self, request_dict, **query_kwargs):
+        """
+        Coroutine version of ``query`` for callers that already run an event
+        loop. It can be awaited from any loop.
+        """
+        return await self._run_async(self._request_async_response,
+                                     request_dict,
+                                     **query_kwargs)
+
     def query(self, request_dict, **query_kwargs):
-        return self.asyncio_loop.run_until_complete(
-            self._request_async_response(request_dict,
-                                         **query_kwargs))
+        return self._run(self._request_async_response, request_dict, **query_kwargs)
 
-    async def terminate_async(self):
+    async def _terminate(self):
         await self.stub.Terminate(
             modelresponse_pb2.google_dot_protobuf_dot_empty__pb2.Empty())
 
-    def terminate(self):
-        self.asyncio_loop.run_until_complete(self.terminate_async())
+    async def terminate_async(self):
+        try:
+            await self._run_async(self._terminate)
+        finally:
+            await self.close_async()
 
-    async def create_session_async(self, session_id):
+    def terminate(self):
+        try:
+            self._run(self._terminate)
+        finally:
+            self.close()
+
+    async def close_async(self):
+        if not self._closed:
+            await self._run_async(self.channel.close)
+            self._closed = True
+
+    def close(self):
+        """
+        Close the gRPC channel. The client cannot be used afterwards.
+        """
+        if not self._closed:
+            self._run(self.channel.close)
+            self._closed = True
+
+    async def _create_session(self, session_id):
         return await self.stub.CreateSession(
             modelresponse_pb2.SessionID(session_id=session_id))
 
+    async def create_session_async(self, session_id):
+        return await self._run_async(self._create_session, session_id)
+
     def create_session(self, session_id):
         assert (
             self.task == TaskType.TEXT_GENERATION
         ), f"Session creation only available for task '{TaskType.TEXT_GENERATION}'."
-        return self.asyncio_loop.run_until_complete(
-            self.create_session_async(session_id))
+        return self._run(self._create_session, session_id)
 
-    async def destroy_session_async(self, session_id):
+    async def _destroy_session(self, session_id):
         await self.stub.DestroySession(modelresponse_pb2.SessionID(session_id=session_id)
                                        )
 
+    async def destroy_session_async(self, session_id):
+        await self._run_async(self._destroy_session, session_id)
+
     def destroy_session(self, session_id):
         assert (
             self.task == TaskType.TEXT_GENERATION
         ), f"Session deletion only available for task '{TaskType.TEXT_GENERATION}'."
-        self.asyncio_loop.run_until_complete(self.destroy_session_async(session_id))
+        self._run(self._destroy_session, session_id)
 
 
 class MIINonPersistentClient:
@@ -4,7 +4,7 @@
 # DeepSpeed Team
 import torch
 import os
-import string
+import re
 from pydantic import field_validator, model_validator, Field
 from typing import List, Optional, Dict, Any
 
@@ -15,6 +15,10 @@ from deepspeed.launcher.runner import DLTS_HOSTFILE, fetch_hostfile
 import mii.legacy as mii
 from .constants import DeploymentType, TaskType, ModelProvider, MII_MODEL_PATH_DEFAULT
 
+HALF_PRECISION_DEFAULT_TASKS = (TaskType.TEXT_GENERATION, TaskType.TEXT_CLASSIFICATION)
+BLOOM_MODEL_NAMES = ("bigscience/bloom", "microsoft/bloom-deepspeed-inference")
+AML_DEPLOYMENT_NAME_RE = re.compile(r"[A-Za-z0-9-]*")
+
 
 class ReplicaConfig(DeepSpeedConfigModel):
     hostname: str = ""
@@ -43,7 +47,10 @@ class ModelConfig(DeepSpeedConfigModel):
     dtype: torch.dtype = torch.float32
     """
     Desired model data type, will convert model to this type.  Supported target
-    types: `torch.half`, `torch.float`, `torch.int8` (for BLOOM models)
+    types: `torch.half`, `torch.float`, `torch.int8` (for BLOOM models). If not
+    provided, defaults to `torch.half` for `text-generation` and
+    `text-classification` tasks (unless ZeRO-Inference is enabled) and
+    `torch.float` otherwise.
     """
 
     model_path: str = ""
@@ -204,39 +211,6 @@ class ModelConfig(DeepSpeedConfigModel):
             return field_value
         raise TypeError(f"Invalid type for dtype: {type(field_value)}")
 
-    @model_validator(mode="after")
-    def zero_or_meta(self):
-        if self.enable_zero:
-            assert not self.meta_tensor, "ZeRO-Inference does not support meta tensors."
-        return self
-
-    @model_validator(mode="after")
-    def bloom_model_valid(self):
-        if "bigscience/bloom" in self.model:
-            # TODO: SHould be albe to use DtypeEnum here
-            assert self.dtype in [
-                torch.int8,
-                torch.float16,
-            ], "Bloom models only support fp16/int8."
-            assert not self.enable_cuda_graph, "Bloom models do not support CUDA Graph."
-        return self
-
-    @model_validator(mode="after")
-    def deploy_rank_valid(self):
-        deploy_rank = self.deploy_rank
-
-        # if deploy rank is not given, default to align with TP value
-        if deploy_rank is None:
-            deploy_rank = list(range(self.tensor_parallel))
-
-        # number of ranks provided must be equal to TP size, DP is handled outside MII currently
-        assert self.tensor_parallel == len(
-            deploy_rank
-        ), f"{len(deploy_rank)} rank(s) provided in 'deploy_rank' does not align with tensor_parallel size of {self.tensor_parallel}"
-
-        self.__dict__["deploy_rank"] = deploy_rank
-        return self
-
     @model_validator(mode="before")
     @classmethod
     def set_model_path(cls, values):
@@ -259,46 +233,74 @@ class ModelConfig(DeepSpeedConfigModel):
         values["model_path"] = model_path
         return values
 
-    @model_validator(mode="after")
-    def validate_model_and_task(self):
-        if not self.skip_model_check:
-            mii.utils.check_if_task_and_model_is_valid(self.task, self.model)
-            mii.utils.check_if_task_and_model_is_supported(self.task, self.model)
-        return self
+    @model_validator(mode="before")
+    @classmethod
+    def set_default_dtype(cls, values):
+        if values.get("dtype") is None and not values.get("enable_zero", False):
+            if values.get("task") in HALF_PRECISION_DEFAULT_TASKS:
+                values["dtype"] = torch.float16
+        return values
 
     @model_validator(mode="after")
-    def meta_tensor_or_sys_mem(self):
-        if self.meta_tensor and self.load_with_sys_mem:
-            raise ValueError(
-                "`meta_tensor` and `load_with_sys_mem` cannot be active at the same time."
-            )
-        return self
+    def validate_model_config(self):
+        # All post-init checks are done in a single validator so that each
+        # field is only looked up once per ModelConfig construction.
+        model = self.model
+        task = self.task
+        dtype = self.dtype
+        enable_zero = self.enable_zero
+        meta_tensor = self.meta_tensor
+        load_with_sys_mem = self.load_with_sys_mem
+        tensor_parallel = self.tensor_parallel
 
-    @model_validator(mode="after")
-    def sys_mem_and_diffusers(self):
-        if self.load_with_sys_mem:
-            assert not (mii.utils.get_provider(self.model, self.task) == ModelProvider.DIFFUSERS), "`load_with_sys_mem` is not support with Stable Diffusion"
-        return self
+        assert not (
+            self.enable_deepspeed and enable_zero
+        ), "DeepSpeed and ZeRO cannot both be enabled, select only one"
 
-    @model_validator(mode="after")
-    def zero_dtype_valid(self):
-        if self.enable_zero:
+        if enable_zero:
+            assert not meta_tensor, "ZeRO-Inference does not support meta tensors."
             if self.ds_config.get("fp16", {}).get("enabled", False):
                 # TODO: We should be able to use DtypeEnum instead of torch.float
                 assert (
-                    self.dtype == torch.float16
+                    dtype == torch.float16
                 ), "ZeRO FP16 enabled, `dtype` must be set to `torch.float16`"
             else:
                 assert (
-                    self.dtype == torch.float32
+                    dtype == torch.float32
                 ), "ZeRO FP16 disabled, `dtype` must be set to `torch.float32`"
-        return self
 
-    @model_validator(mode="after")
-    def deepspeed_or_zero(self):
-        assert not (
-            self.enable_deepspeed and self.enable_zero
-        ), "DeepSpeed and ZeRO cannot both be enabled, select only one"
+        if meta_tensor and load_with_sys_mem:
+            raise ValueError(
+                "`meta_tensor` and `load_with_sys_mem` cannot be active at the same time."
+            )
+
+        if load_with_sys_mem:
+            assert not (mii.utils.get_provider(model, task) == ModelProvider.DIFFUSERS), "`load_with_sys_mem` is not support with Stable Diffusion"
+
+        is_bloom = any(name in model for name in BLOOM_MODEL_NAMES)
+        if is_bloom:
+            # TODO: SHould be albe to use DtypeEnum here
+            assert dtype in [
+                torch.int8,
+                torch.float16,
+            ], "Bloom models only support fp16/int8."
+            assert not self.enable_cuda_graph, "Bloom models do not support CUDA Graph."
+
+        # if deploy rank is not given, default to align with TP value
+        deploy_rank = self.deploy_rank
+        if deploy_rank is None:
+            deploy_rank = list(range(tensor_parallel))
+
+        # number of ranks provided must be equal to TP size, DP is handled outside MII currently
+        assert tensor_parallel == len(
+            deploy_rank
+        ), f"{len(deploy_rank)} rank(s) provided in 'deploy_rank' does not align with tensor_parallel size of {tensor_parallel}"
+        self.__dict__["deploy_rank"] = deploy_rank
+
+        if not self.skip_model_check:
+            mii.utils.check_if_task_and_model_is_valid(task, model)
+            mii.utils.check_if_task_and_model_is_supported(task, model)
+
         return self
 
 
@@ -355,20 +357,21 @@ class MIIConfig(DeepSpeedConfigModel):
     @model_validator(mode="after")
     def AML_name_valid(self):
         if self.deployment_type == DeploymentType.AML:
-            allowed_chars = set(string.ascii_lowercase + string.ascii_uppercase +
-                                string.digits + "-")
-            assert (
-                set(self.deployment_name) <= allowed_chars
+            assert AML_DEPLOYMENT_NAME_RE.fullmatch(
+                self.deployment_name
             ), "AML deployment names can only contain a-z, A-Z, 0-9, and '-'."
         return self
 
     def generate_replica_configs(self):
         # TODO: refactor this function
+        model_conf = self.model_conf
+        if model_conf.replica_configs:
+            return
         hostfile = self.hostfile
         port_number = self.port_number
-        torch_dist_port = self.model_conf.torch_dist_port
-        tensor_parallel = self.model_conf.tensor_parallel
-        replica_num = self.model_conf.replica_num
+        torch_dist_port = model_conf.torch_dist_port
+        tensor_parallel = model_conf.tensor_parallel
+        replica_num = model_conf.replica_num
         replica_pool = _allocate_processes(hostfile, tensor_parallel, replica_num)
         replica_configs = []
         for i, (hostname, gpu_indices) in enumerate(replica_pool):
@@ -385,7 +388,7 @@ class MIIConfig(DeepSpeedConfigModel):
                     gpu_indices=gpu_indices,
                 ))
 
-        self.model_conf.replica_configs = replica_configs
+        model_conf.replica_configs = replica_configs
 
 
 def _allocate_processes(hostfile_path, tensor_parallel, replica_num):
@@ -397,28 +400,14 @@ def _allocate_processes(hostfile_path, tensor_parallel, replica_num):
     replica_pool = []
     allocated_num = 0
     for host, slots in resource_pool.items():
-        available_on_host = slots
-        while available_on_host >= tensor_parallel:
-            if allocated_num >= replica_num:
-                break
-            if slots < tensor_parallel:
-                raise ValueError(
-                    f"Host {host} has {slots} slot(s), but {tensor_parallel} slot(s) are required"
-                )
-
-            allocated_num_on_host = slots - available_on_host
-            replica_pool.append((
-                host,
-                [
-                    i for i in range(
-                        allocated_num_on_host,
-                        allocated_num_on_host + tensor_parallel,
-                    )
-                ],
-            ))
-            allocated_num += 1
-
-            available_on_host -= tensor_parallel
+        if allocated_num >= replica_num:
+            break
+        replicas_on_host = min(slots // tensor_parallel, replica_num - allocated_num)
+        replica_pool.extend((host,
+                             list(range(i * tensor_parallel,
+                                        (i + 1) * tensor_parallel)))
+                            for i in range(replicas_on_host))
+        allocated_num += replicas_on_host
 
     if allocated_num < replica_num:
         raise ValueError(
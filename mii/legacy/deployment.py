@@ -6,8 +6,7 @@ import os
 import mii.legacy as mii
 
 from .logging import logger
-from .models.score import create_score_file
-from .models import load_models
+from .models.score import create_score_file, build_score_module
 from .config import MIIConfig, DeploymentType
 
 
@@ -92,7 +91,7 @@ def deploy(
 
 
 def _deploy_local(mii_config):
-    mii.utils.import_score_file(mii_config.deployment_name, DeploymentType.LOCAL).init()
+    build_score_module(mii_config).init()
 
 
 def _deploy_aml(mii_config):
@@ -117,6 +116,9 @@ def _deploy_nonpersistent(mii_config):
         int(os.getenv("WORLD_SIZE", "1"))
         == mii_config.model_conf.tensor_parallel
     ), "World Size does not equal number of tensors. When using non-persistent deployment type, please launch with `deepspeed --num_gpus <tensor_parallel>`"
+    # Only non-persistent deployments load the model in this process
+    from .models.load_models import load_models
+
     deployment_name = mii_config.deployment_name
     mii.non_persistent_models[deployment_name] = (
         load_models(mii_config.model_conf),
@@ -25,6 +25,7 @@ from mii.legacy.constants import (
 from mii.legacy.method_table import GRPC_METHOD_TABLE
 from mii.legacy.client import create_channel
 from mii.legacy.utils import unpack_proto_query_kwargs
+from mii.legacy.logging import logger
 
 
 class ServiceBase(modelresponse_pb2_grpc.ModelResponseServicer):
@@ -143,6 +144,15 @@ def _get_grpc_method_name(method):
     return method.split("/")[-1]
 
 
+def _first_response(method_name, responses):
+    for rank, response in enumerate(responses[1:], start=1):
+        if isinstance(response, Exception):
+            logger.warning(f"{method_name} failed on rank {rank}: {response}")
+    if isinstance(responses[0], Exception):
+        raise responses[0]
+    return responses[0]
+
+
 class ParallelStubInvoker:
     """
     Invokes a gRPC method on multiple endpoints in parallel.
@@ -160,11 +170,18 @@ class ParallelStubInvoker:
         self.asyncio_loop = asyncio.get_event_loop()
 
     async def _invoke_async(self, method_name, proto_request):
-        responses = []
-        for stub in self.stubs:
-            method = getattr(stub, method_name)
-            responses.append(method(proto_request))
-        return await responses[0]
+        if len(self.stubs) == 1:
+            return await getattr(self.stubs[0], method_name)(proto_request)
+        # Every rank has to receive the request, and every call is awaited so
+        # none is left pending once the first one returns
+        calls = (getattr(stub, method_name)(proto_request) for stub in self.stubs)
+        if method_name != TERMINATE_METHOD:
+            responses = await asyncio.gather(*calls)
+            return responses[0]
+        # Every rank is asked to terminate even if another rank has already
+        # gone away, and only a failure on the first rank is raised
+        responses = await asyncio.gather(*calls, return_exceptions=True)
+        return _first_response(method_name, responses)
 
     def invoke(self, method_name, proto_request):
         # This is needed because gRPC calls from interceptor are launched from
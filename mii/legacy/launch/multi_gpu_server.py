@@ -18,8 +18,8 @@ def b64_encoded_config(config_str):
     b64_bytes = config_str.encode()
     # decode b64 bytes -> json bytes
     config_bytes = base64.urlsafe_b64decode(b64_bytes)
-    # convert json bytes -> str -> dict
-    config_dict = json.loads(config_bytes.decode())
+    # convert json bytes -> dict
+    config_dict = json.loads(config_bytes)
     # return mii.ModelConfig object
     return ModelConfig(**config_dict)
 
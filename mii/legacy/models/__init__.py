@@ -3,4 +3,3 @@
 
 # DeepSpeed Team
 from .score import create_score_file
-from .load_models import load_models
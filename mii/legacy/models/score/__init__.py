@@ -2,4 +2,4 @@
 # SPDX-License-Identifier: Apache-2.0
 
 # DeepSpeed Team
-from .generate import create_score_file, generated_score_path
+from .generate import create_score_file, build_score_module, generated_score_path
@@ -11,13 +11,18 @@ import time
 from collections import defaultdict
 from deepspeed.accelerator import get_accelerator
 
+from mii.legacy.constants import (
+    SERVER_START_POLL_INTERVAL_MIN,
+    SERVER_START_POLL_INTERVAL_MAX,
+    SERVER_START_LOG_INTERVAL,
+)
 from mii.legacy.utils import get_num_gpus
 from mii.legacy.logging import logger
 
 
 def config_to_b64_str(config):
     # convert json str -> bytes
-    json_bytes = config.json().encode()
+    json_bytes = config.model_dump_json().encode()
     # base64 encoded bytes
     b64_config_bytes = base64.urlsafe_b64encode(json_bytes)
     # bytes -> str
@@ -48,6 +53,8 @@ class MIIServer:
 
     def _wait_until_server_is_live(self, processes, deployment):
         for process, repl_config in zip(processes, deployment):
+            poll_interval = SERVER_START_POLL_INTERVAL_MIN
+            last_log_time = time.time()
             sockets_open = False
             while not sockets_open:
                 sockets_open = all(
@@ -58,8 +65,13 @@ class MIIServer:
                 if not process_alive:
                     raise RuntimeError(
                         "server crashed for some reason, unable to proceed")
-                time.sleep(4)
-                logger.info("waiting for server to start...")
+                if not sockets_open:
+                    time.sleep(poll_interval)
+                    poll_interval = min(2 * poll_interval,
+                                        SERVER_START_POLL_INTERVAL_MAX)
+                    if time.time() - last_log_time >= SERVER_START_LOG_INTERVAL:
+                        logger.info("waiting for server to start...")
+                        last_log_time = time.time()
             logger.info(
                 f"server has started on ports {repl_config.tensor_parallel_ports}")
 
@@ -74,15 +86,8 @@ class MIIServer:
     def _is_server_process_alive(self, process):
         if process is None:
             return True
-        try:
-            process.wait(1)
-        except subprocess.TimeoutExpired as err:
-            # timeout means we're still running and all (probably) okay
-            is_alive = True
-        else:
-            # no exception case
-            is_alive = False
-        return is_alive
+        # poll() returns None while the process is still running
+        return process.poll() is None
 
     def _launch_server_process(self,
                                model_config,
@@ -99,7 +104,7 @@ class MIIServer:
 
         mii_env = os.environ.copy()
         mii_env["TRANSFORMERS_CACHE"] = model_config.model_path
-        logger.info(f"{msg_server_type} server launch: {cmd}")
+        logger.debug(f"{msg_server_type} server launch: {cmd}")
         return subprocess.Popen(cmd, env=mii_env)
 
     def _generate_ds_launch_str(self, replica_config, hostfile):
@@ -6,6 +6,7 @@ import os
 import pickle
 import time
 import importlib
+import functools
 import torch
 import mii.legacy as mii
 from types import SimpleNamespace
@@ -91,6 +92,9 @@ def get_supported_models(task):
     return supported_models
 
 
+# Results are cached per (task, model_name) so that repeated ModelConfig
+# validation (e.g., on attribute assignment) does not reload the model list.
+@functools.lru_cache(maxsize=256)
 def check_if_task_and_model_is_supported(task, model_name):
     supported_models = get_supported_models(task)
     assert (
@@ -98,6 +102,7 @@ def check_if_task_and_model_is_supported(task, model_name):
     ), f"{task} is not supported by {model_name}. This task is supported by {len(supported_models)} other models. See which models with `mii.get_supported_models(mii.{task})`."
 
 
+@functools.lru_cache(maxsize=256)
 def check_if_task_and_model_is_valid(task, model_name):
     valid_task_models = _get_hf_models_by_type(None, task)
     assert (
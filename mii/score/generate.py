@@ -3,11 +3,25 @@
 
 # DeepSpeed Team
 import os
+import types
+from functools import lru_cache
 import mii
-import pprint
 from mii.logging import logger
 from mii.constants import DeploymentType
 
+SCORE_TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), "score_template.py")
+
+
+@lru_cache(maxsize=1)
+def _score_template_src():
+    with open(SCORE_TEMPLATE_PATH, "r") as fd:
+        return fd.read()
+
+
+@lru_cache(maxsize=1)
+def _score_template_code():
+    return compile(_score_template_src(), SCORE_TEMPLATE_PATH, "exec")
+
 
 def create_score_file(mii_config):
     if len(mii.__path__) > 1:
@@ -15,13 +29,12 @@ def create_score_file(mii_config):
             f"Detected mii path as multiple sources: {mii.__path__}, might cause unknown behavior"
         )
 
-    with open(os.path.join(mii.__path__[0], "score/score_template.py"), "r") as fd:
-        score_src = fd.read()
+    score_src = _score_template_src()
 
     # update score file w. global config dict
     config_dict = mii_config.model_dump()
     source_with_config = f"{score_src}\n"
-    source_with_config += f"mii_config = {pprint.pformat(config_dict, indent=4)}"
+    source_with_config += f"mii_config = {config_dict!r}"
 
     with open(
             generated_score_path(mii_config.deployment_name,
@@ -31,6 +44,15 @@ def create_score_file(mii_config):
         fd.write("\n")
 
 
+def build_score_module(mii_config):
+    # Equivalent to importing the file written by create_score_file, without
+    # reading it back from disk and re-compiling the template each time
+    score = types.ModuleType("score")
+    exec(_score_template_code(), score.__dict__)
+    score.mii_config = mii_config.model_dump()
+    return score
+
+
 def generated_score_path(deployment_name, deployment_type):
     if deployment_type == DeploymentType.LOCAL:
         score_path = os.path.join(mii.utils.mii_cache_path(), deployment_name)
@@ -3,7 +3,7 @@
 
 # DeepSpeed Team
 import os
-import sys
+import shutil
 import subprocess
 from setuptools import setup, find_packages
 
@@ -19,23 +19,17 @@ extras_require = {"dev": fetch_requirements('requirements/requirements-dev.txt')
 
 
 def command_exists(cmd):
-    if sys.platform == "win32":
-        result = subprocess.Popen(f'{cmd}', stdout=subprocess.PIPE, shell=True)
-        return result.wait() == 1
-    else:
-        result = subprocess.Popen(f'type {cmd}', stdout=subprocess.PIPE, shell=True)
-        return result.wait() == 0
+    return shutil.which(cmd) is not None
 
 
 # Write out version/git info
-git_hash_cmd = "git rev-parse --short HEAD"
-git_branch_cmd = "git rev-parse --abbrev-ref HEAD"
+# --short forces a single revision, so the hash is shortened here instead
+git_info_cmd = "git rev-parse HEAD --abbrev-ref HEAD"
 if command_exists('git') and 'DS_BUILD_STRING' not in os.environ:
     try:
-        result = subprocess.check_output(git_hash_cmd, shell=True)
-        git_hash = result.decode('utf-8').strip()
-        result = subprocess.check_output(git_branch_cmd, shell=True)
-        git_branch = result.decode('utf-8').strip()
+        result = subprocess.check_output(git_info_cmd, shell=True)
+        git_hash, git_branch = result.decode('utf-8').split()
+        git_hash = git_hash[:7]
     except subprocess.CalledProcessError:
         git_hash = "unknown"
         git_branch = "unknown"
@@ -75,7 +69,6 @@ with open("mii/version.py", 'w') as fd:
 thisdir = os.path.abspath(os.path.dirname(__file__))
 with open(os.path.join(thisdir, 'README.md'), encoding='utf-8') as fin:
     readme_text = fin.read()
-print("PACKAGES", find_packages())
 setup(name="deepspeed-mii",
       version=version_str,
       long_description=readme_text,
@@ -0,0 +1,99 @@
+# Copyright (c) Microsoft Corporation.
+# SPDX-License-Identifier: Apache-2.0
+
+# DeepSpeed Team
+
+import asyncio
+import threading
+from concurrent import futures
+
+import grpc
+import pytest
+
+import mii.legacy as mii
+from mii.legacy.grpc_related.proto import legacymodelresponse_pb2 as modelresponse_pb2
+from mii.legacy.grpc_related.proto import legacymodelresponse_pb2_grpc as modelresponse_pb2_grpc
+
+
+SERVER_THREAD_PREFIX = "echo-server"
+
+
+def client_thread_count():
+    return sum(not t.name.startswith(SERVER_THREAD_PREFIX) for t in threading.enumerate())
+
+
+class EchoService(modelresponse_pb2_grpc.ModelResponseServicer):
+    def GeneratorReply(self, request, context):
+        return modelresponse_pb2.MultiStringReply(
+            response=[f"{r}!" for r in request.request])
+
+    def Terminate(self, request, context):
+        return modelresponse_pb2.google_dot_protobuf_dot_empty__pb2.Empty()
+
+
+@pytest.fixture(scope="module")
+def port():
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=4,
+                                   thread_name_prefix=SERVER_THREAD_PREFIX))
+    modelresponse_pb2_grpc.add_ModelResponseServicer_to_server(EchoService(), server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    yield port
+    server.stop(None)
+
+
+@pytest.fixture
+def client(port):
+    client = mii.MIIClient(mii.TaskType.TEXT_GENERATION, "localhost", port)
+    yield client
+    client.close()
+
+
+def test_query(client):
+    assert client.query({"query": ["a", "b"]}).response == ["a!", "b!"]
+
+
+def test_query_async(client):
+    async def query_all():
+        # Awaited from a loop that is not the client's own loop
+        return await asyncio.gather(
+            *(client.query_async({"query": [str(i)]}) for i in range(8)))
+
+    responses = asyncio.run(query_all())
+    assert [r.response[0] for r in responses] == [f"{i}!" for i in range(8)]
+
+
+def test_query_in_running_loop(client):
+    async def query():
+        return client.query({"query": ["a"]})
+
+    assert asyncio.run(query()).response == ["a!"]
+
+
+def test_query_threads(client):
+    with futures.ThreadPoolExecutor(max_workers=8) as executor:
+        responses = executor.map(lambda i: client.query({"query": [str(i)]}), range(32))
+        assert [r.response[0] for r in responses] == [f"{i}!" for i in range(32)]
+
+
+def test_terminate(port):
+    # The first client starts the shared loop thread and gRPC's poller thread
+    client = mii.MIIClient(mii.TaskType.TEXT_GENERATION, "localhost", port)
+    client.query({"query": ["a"]})
+    client.terminate()
+    thread_count = client_thread_count()
+    clients = [
+        mii.MIIClient(mii.TaskType.TEXT_GENERATION,
+                      "localhost",
+                      port) for _ in range(5)
+    ]
+    assert client_thread_count() == thread_count
+    for client in clients[1:]:
+        client.terminate()
+    asyncio.run(clients[0].terminate_async())
+    assert client_thread_count() == thread_count
+
+    for client in clients:
+        with pytest.raises(RuntimeError, match="closed"):
+            client.query({"query": ["a"]})
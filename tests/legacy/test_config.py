@@ -3,7 +3,9 @@
 
 # DeepSpeed Team
 
+import json
 import pytest
+import torch
 
 import mii.legacy as mii
 from pydantic import ValidationError
@@ -27,3 +29,117 @@ def test_base_configs_literalfail(deployment_name, mii_config, model_config):
         mii_config["deployment_name"] = deployment_name
         mii_config["model_conf"] = model_config
         mii_config = mii.config.MIIConfig(**mii_config)
+
+
+@pytest.mark.parametrize(
+    "hostfile_content, tensor_parallel, replica_num, expected",
+    [
+        (["host_0 slots=4"],
+         2,
+         2,
+         [("host_0",
+           [0,
+            1]),
+          ("host_0",
+           [2,
+            3])]),
+        (["host_0 slots=3",
+          "host_1 slots=2"],
+         2,
+         2,
+         [("host_0",
+           [0,
+            1]),
+          ("host_1",
+           [0,
+            1])]),
+        (["host_0 slots=8"],
+         1,
+         3,
+         [("host_0",
+           [0]),
+          ("host_0",
+           [1]),
+          ("host_0",
+           [2])]),
+    ],
+)
+def test_allocate_processes(tmpdir, hostfile_content, tensor_parallel, replica_num, expected):
+    hostfile_path = tmpdir.join("hostfile")
+    hostfile_path.write("\n".join(hostfile_content) + "\n")
+    replica_pool = mii.config._allocate_processes(str(hostfile_path),
+                                                  tensor_parallel,
+                                                  replica_num)
+    assert replica_pool == expected
+
+
+@pytest.mark.parametrize("hostfile_content", [["host_0 slots=2", "host_1 slots=1"]])
+def test_allocate_processes_fail(tmpdir, hostfile_content):
+    hostfile_path = tmpdir.join("hostfile")
+    hostfile_path.write("\n".join(hostfile_content) + "\n")
+    with pytest.raises(ValueError):
+        mii.config._allocate_processes(str(hostfile_path), 2, 2)
+
+
+def test_cuda_graph_default():
+    # CUDA Graph must stay opt-in: DeepSpeed rejects it with kernel injection
+    # for most text-generation policies
+    model_config = mii.config.ModelConfig(model="gpt2",
+                                          task="text-generation",
+                                          tensor_parallel=1,
+                                          replace_with_kernel_inject=True,
+                                          skip_model_check=True)
+    assert not model_config.enable_cuda_graph
+
+
+@pytest.mark.parametrize(
+    "task, expected",
+    [
+        ("text-generation",
+         torch.float16),
+        ("text-classification",
+         torch.float16),
+        ("fill-mask",
+         torch.float32),
+        ("question-answering",
+         torch.float32),
+    ],
+)
+def test_default_dtype(task, expected):
+    model_config = mii.config.ModelConfig(model="model", task=task, skip_model_check=True)
+    assert model_config.dtype == expected
+
+
+def test_explicit_dtype():
+    model_config = mii.config.ModelConfig(model="gpt2",
+                                          task="text-generation",
+                                          dtype="fp32",
+                                          skip_model_check=True)
+    assert model_config.dtype == torch.float32
+
+
+def test_zero_default_dtype():
+    model_config = mii.config.ModelConfig(model="gpt2",
+                                          task="text-generation",
+                                          enable_deepspeed=False,
+                                          enable_zero=True,
+                                          skip_model_check=True)
+    assert model_config.dtype == torch.float32
+
+
+@pytest.mark.parametrize("model", ["bigscience/bloom-560m", "/data/bigscience/bloom-560m"])
+def test_bloom_dtype_fail(model):
+    with pytest.raises(ValidationError):
+        mii.config.ModelConfig(model=model,
+                               task="text-generation",
+                               dtype="fp32",
+                               skip_model_check=True)
+
+
+def test_model_config_json_roundtrip():
+    model_config = mii.config.ModelConfig(model="gpt2",
+                                          task="text-generation",
+                                          skip_model_check=True)
+    # Same path the launcher takes to pass the config to server processes
+    loaded_config = mii.config.ModelConfig(**json.loads(model_config.model_dump_json()))
+    assert loaded_config.dtype == torch.float16
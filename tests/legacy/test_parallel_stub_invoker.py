@@ -0,0 +1,44 @@
+# Copyright (c) Microsoft Corporation.
+# SPDX-License-Identifier: Apache-2.0
+
+# DeepSpeed Team
+
+import asyncio
+import pytest
+
+from google.protobuf import empty_pb2
+from mii.legacy.constants import TERMINATE_METHOD
+from mii.legacy.grpc_related.modelresponse_server import ParallelStubInvoker
+
+
+class FakeStub:
+    def __init__(self, fail):
+        self.fail = fail
+        self.called = False
+
+    async def Terminate(self, request):
+        self.called = True
+        if self.fail:
+            raise RuntimeError("rank is unavailable")
+        return empty_pb2.Empty()
+
+
+def _invoker(failing_ranks, num_ranks=3):
+    invoker = ParallelStubInvoker.__new__(ParallelStubInvoker)
+    invoker.stubs = [FakeStub(rank in failing_ranks) for rank in range(num_ranks)]
+    return invoker
+
+
+@pytest.mark.parametrize("failing_ranks", [[], [1], [1, 2]])
+def test_terminate_ignores_other_ranks(failing_ranks):
+    invoker = _invoker(failing_ranks)
+    response = asyncio.run(invoker._invoke_async(TERMINATE_METHOD, empty_pb2.Empty()))
+    assert response == empty_pb2.Empty()
+    assert all(stub.called for stub in invoker.stubs)
+
+
+def test_terminate_first_rank_fail():
+    invoker = _invoker([0])
+    with pytest.raises(RuntimeError):
+        asyncio.run(invoker._invoke_async(TERMINATE_METHOD, empty_pb2.Empty()))
+    assert all(stub.called for stub in invoker.stubs)
@@ -0,0 +1,108 @@
+# Copyright (c) Microsoft Corporation.
+# SPDX-License-Identifier: Apache-2.0
+
+# DeepSpeed Team
+
+import asyncio
+import threading
+from concurrent import futures
+
+import grpc
+import pytest
+
+from mii.backend.client import MIIClient
+from mii.config import MIIConfig
+from mii.grpc_related.proto import modelresponse_pb2, modelresponse_pb2_grpc
+
+SERVER_THREAD_PREFIX = "echo-server"
+
+
+def client_thread_count():
+    return sum(not t.name.startswith(SERVER_THREAD_PREFIX) for t in threading.enumerate())
+
+
+def _reply(texts):
+    return modelresponse_pb2.MultiGenerationReply(response=[
+        modelresponse_pb2.SingleGenerationReply(response=text,
+                                                finish_reason="length") for text in texts
+    ])
+
+
+class EchoService(modelresponse_pb2_grpc.ModelResponseServicer):
+    def GeneratorReply(self, request, context):
+        return _reply([f"{r}!" for r in request.request])
+
+    def GeneratorReplyStream(self, request, context):
+        for token in ("a", "b", "c"):
+            yield _reply([token])
+
+    def Terminate(self, request, context):
+        return modelresponse_pb2.google_dot_protobuf_dot_empty__pb2.Empty()
+
+
+@pytest.fixture(scope="module")
+def mii_config():
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=4,
+                                   thread_name_prefix=SERVER_THREAD_PREFIX))
+    modelresponse_pb2_grpc.add_ModelResponseServicer_to_server(EchoService(), server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    yield MIIConfig(deployment_name="test",
+                    model_conf={"model_name_or_path": "gpt2"},
+                    port_number=port)
+    server.stop(None)
+
+
+@pytest.fixture
+def client(mii_config):
+    client = MIIClient(mii_config)
+    yield client
+    client.close()
+
+
+def test_generate(client):
+    responses = client.generate(["a", "b"])
+    assert [r.generated_text for r in responses] == ["a!", "b!"]
+
+
+def test_generate_in_running_loop(client):
+    async def generate():
+        return client.generate("a")
+
+    assert asyncio.run(generate())[0].generated_text == "a!"
+
+
+def test_generate_threads(client):
+    with futures.ThreadPoolExecutor(max_workers=8) as executor:
+        responses = executor.map(lambda i: client.generate(str(i)), range(32))
+        assert [r[0].generated_text for r in responses] == [f"{i}!" for i in range(32)]
+
+
+def test_generate_stream(client):
+    tokens = []
+
+    def callback(response):
+        # Streaming callbacks run in the calling thread
+        assert threading.current_thread() is threading.main_thread()
+        tokens.append(response[0].generated_text)
+
+    client.generate("a", streaming_fn=callback)
+    assert tokens == ["a", "b", "c"]
+
+
+def test_terminate_server(mii_config):
+    # The first client starts the shared loop thread and gRPC's poller thread
+    client = MIIClient(mii_config)
+    client.generate("a")
+    client.terminate_server()
+    thread_count = client_thread_count()
+    clients = [MIIClient(mii_config) for _ in range(5)]
+    assert client_thread_count() == thread_count
+    for client in clients:
+        client.terminate_server()
+    assert client_thread_count() == thread_count
+
+    for client in clients:
+        with pytest.raises(RuntimeError, match="closed"):
+            client.generate("a")